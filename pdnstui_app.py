@@ -0,0 +1,1178 @@
+"""
+PowerDNS TUI Manager - Textual application and PowerDNS API wrapper.
+
+Imported by pdnstui.main() once the command line has been validated.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Dict, Optional
+from datetime import date, datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from powerdns import PDNSApiClient, RRSet
+from powerdns.exceptions import PDNSError
+from powerdns.interface import PDNSServer, PDNSZone
+from textual.app import App, ComposeResult
+from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
+from textual.widgets import (
+    Header, Footer, DataTable, Input, Button, Static, Label,
+    Select, TextArea, TabbedContent, TabPane
+)
+from textual.binding import Binding
+from textual.screen import Screen, ModalScreen
+from textual.message import Message
+from textual import events, work
+from textual.worker import get_current_worker
+
+if TYPE_CHECKING:
+    from pdnstui import Config, ServerConfig
+
+# SOA content for newly created zones: primary NS, hostmaster, serial, refresh/retry/expire/minimum
+_SOA_TMPL = "ns1.{n} hostmaster.{n} {s} 28800 7200 604800 86400"
+
+# One pooled session shared by every server so connections and TLS handshakes are reused
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# (connect, read) timeouts in seconds, so an unreachable or hung server fails instead of blocking forever
+_TIMEOUT = (5, 30)
+# The /servers probe answers instantly on a healthy server, so give up on it much sooner
+_PROBE_TIMEOUT = (5, 5)
+
+
+class SessionApiClient(PDNSApiClient):
+    """PowerDNS API client that sends requests over the shared keep-alive session.
+    
+    PDNSApiClient calls requests.request(), which opens a new connection for
+    every API call, and offers no way to pass a session. request() below
+    mirrors python-powerdns 2.1's PDNSApiClient.request (including its
+    private attributes), so the dependency is pinned to 2.1.x.
+    """
+    
+    def request(self, path, method, data=None, **kwargs):
+        if self._api_key:
+            self.request_headers['X-API-Key'] = self._api_key
+        
+        if path.startswith('http://') or path.startswith('https://'):
+            url = path
+        else:
+            url = f"{self._api_endpoint}/{path.lstrip('/')}"
+        
+        response = _SESSION.request(
+            method, url,
+            data=json.dumps(data if data is not None else {}),
+            headers=self.request_headers,
+            timeout=kwargs.pop('timeout', self._timeout),
+            verify=self._verify,
+            **kwargs
+        )
+        
+        if response.status_code in (200, 201):
+            return response.json()
+        if response.status_code == 204:
+            return ""
+        if response.status_code == 404:
+            error_message = 'Not found'
+        else:
+            try:
+                error_message = self._get_error(response=response.json())
+            except Exception:
+                error_message = response.text
+        raise PDNSError(url=response.url, status_code=response.status_code, message=error_message)
+
+
+class PDNSManager:
+    """Wrapper for PowerDNS API operations."""
+    
+    def __init__(self, url: str, api_key: str, name: str = "Default", cache_ttl: float = 10.0):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        # Ensure URL has /api/v1 suffix if not present
+        base_url = url.rstrip('/')
+        self.api_url = base_url if base_url.endswith('/api/v1') else base_url + '/api/v1'
+        self.client = None
+        self.api_server = None
+        
+        # Short-lived caches so hopping between screens doesn't refetch everything
+        self.cache_ttl = cache_ttl
+        self._zones_cache = None
+        self._zones_ts = 0.0
+        self._zone_cache = {}
+        # RRSet counts of zones opened so far; the zone listing doesn't include them
+        self.record_counts = {}
+        
+        # Extract FQDN from URL for display
+        parsed = urlparse(url)
+        self.fqdn = parsed.hostname or parsed.netloc or url
+        
+    def connect(self):
+        """Establish connection to PowerDNS API."""
+        try:
+            self.client = SessionApiClient(api_endpoint=self.api_url, api_key=self.api_key, timeout=_TIMEOUT)
+            # Get the first server (usually there's only one)
+            servers = self.client.get('/servers', timeout=_PROBE_TIMEOUT)
+            if servers:
+                self.api_server = PDNSServer(self.client, servers[0])
+                return True
+            else:
+                raise Exception("No servers found")
+        except Exception as e:
+            self.api_server = None
+            raise Exception(f"Failed to connect to {self.name}: {str(e)}")
+    
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has found an API server; derived so it can't go stale."""
+        return self.api_server is not None
+    
+    def _server(self):
+        """Return the API server endpoint, connecting first if needed."""
+        server = self.api_server
+        if server is None:
+            self.connect()
+            return self.api_server
+        return server
+    
+    def get_zones(self):
+        """Retrieve the zone listing (summaries without RRSets) from the server."""
+        server = self._server()
+        if self._zones_cache is not None and time.monotonic() - self._zones_ts < self.cache_ttl:
+            return self._zones_cache
+        try:
+            # dnssec=false lets the server skip per-zone DNSSEC lookups when listing
+            self._zones_cache = self.client.get(f"{server.url}/zones", params={"dnssec": "false"})
+            self._zones_ts = time.monotonic()
+            return self._zones_cache
+        except Exception as e:
+            raise Exception(f"Failed to get zones: {str(e)}")
+    
+    def get_zone(self, zone_id: str):
+        """Get a specific zone by ID."""
+        server = self._server()
+        cached = self._zone_cache.get(zone_id)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        # Address the zone directly rather than scanning the library's zone listing,
+        # which is fetched without dnssec=false
+        zone = PDNSZone(self.client, server, {'name': zone_id})
+        self._zone_cache[zone_id] = (time.monotonic(), zone)
+        return zone
+    
+    def invalidate(self, zone_id: str = None):
+        """Drop cached zone data so the next call hits the API."""
+        self._zones_cache = None
+        if zone_id is None:
+            self._zone_cache.clear()
+        else:
+            self._zone_cache.pop(zone_id, None)
+    
+    def create_zone(self, name: str, kind: str = "Native", nameservers: List[str] = None):
+        """Create a new zone."""
+        server = self._server()
+        try:
+            # Create a basic SOA record
+            serial = date.today().strftime("%Y%m%d00")
+            soa_content = _SOA_TMPL.format(n=name, s=serial)
+            soa_r = RRSet(name=name, rtype="SOA", records=[(soa_content, False)], ttl=86400)
+            
+            zone = server.create_zone(
+                name=name,
+                kind=kind,
+                rrsets=[soa_r],
+                nameservers=nameservers or []
+            )
+            self.invalidate(name)
+            return zone
+        except Exception as e:
+            raise Exception(f"Failed to create zone: {str(e)}")
+    
+    def delete_zone(self, zone_id: str):
+        """Delete a zone."""
+        server = self._server()
+        try:
+            server.delete_zone(zone_id)
+            self.invalidate(zone_id)
+            self.record_counts.pop(zone_id, None)
+            return True
+        except Exception as e:
+            raise Exception(f"Failed to delete zone: {str(e)}")
+
+
+class ZoneInfo:
+    """Summary of a zone as listed on the zones screen."""
+    
+    __slots__ = ("manager_idx", "id", "name", "kind", "serial", "records", "notified_serial", "search", "row")
+    
+    def __init__(self, manager_idx: int, manager: PDNSManager, name: str, kind: str,
+                 serial, records, notified_serial):
+        self.manager_idx = manager_idx
+        self.id = name
+        self.name = name
+        self.kind = kind
+        self.serial = serial
+        self.records = records
+        self.notified_serial = notified_serial
+        # Lowercased once here so filtering is a single substring test
+        self.search = f"{name}\x00{kind}\x00{manager.name}\x00{manager.fqdn}".lower()
+        # Table cells, formatted once instead of on every filter pass
+        self.row = (manager.name, manager.fqdn, name, kind, f"{serial}", f"{records}", f"{notified_serial}")
+
+
+class Record:
+    """A single DNS record as listed on the zone details screen."""
+    
+    __slots__ = ("name", "type", "content", "ttl", "disabled", "search", "row")
+    
+    def __init__(self, name: str, rtype: str, content: str, ttl: int, ttl_str: str, disabled: bool):
+        self.name = name
+        self.type = rtype
+        self.content = content
+        self.ttl = ttl
+        self.disabled = disabled
+        # Lowercased once here so filtering is a single substring test
+        self.search = f"{name}\x00{rtype}\x00{content}".lower()
+        # Table cells, formatted once instead of on every filter pass; ttl_str
+        # is str(ttl), formatted by the caller once per RRSet
+        self.row = (
+            name,
+            rtype,
+            content[:50] + "..." if len(content) > 50 else content,
+            ttl_str,
+            "Yes" if disabled else "No"
+        )
+
+
+def _trigrams(text: str) -> set:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CreateZoneModal(ModalScreen[Dict]):
+    """Modal dialog for creating a new zone."""
+    
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+    ]
+    
+    def __init__(self, managers: List[PDNSManager]):
+        super().__init__()
+        self.managers = managers
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="modal-dialog"):
+            yield Static("Create New Zone", classes="dialog-title")
+            
+            # Only show server selection if multiple servers
+            if len(self.managers) > 1:
+                yield Label("Select Server:")
+                yield Select(
+                    [(f"{m.name} ({m.fqdn})", str(i)) for i, m in enumerate(self.managers)],
+                    id="server-select"
+                )
+            
+            yield Label("Zone Name (FQDN):")
+            yield Input(placeholder="example.com.", id="zone-name")
+            yield Label("Zone Type:")
+            yield Select([
+                ("Native", "Native"),
+                ("Master", "Master"),
+                ("Slave", "Slave"),
+            ], value="Native", id="zone-kind")
+            yield Label("Nameservers (comma-separated, optional):")
+            yield Input(placeholder="ns1.example.com., ns2.example.com.", id="nameservers")
+            with Horizontal(classes="dialog-buttons"):
+                yield Button("Create", variant="primary", id="create-btn")
+                yield Button("Cancel", variant="default", id="cancel-btn")
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "create-btn":
+            name = self.query_one("#zone-name", Input).value.strip()
+            kind = self.query_one("#zone-kind", Select).value
+            ns_input = self.query_one("#nameservers", Input).value.strip()
+            
+            if not name:
+                self.notify("Zone name is required", severity="error")
+                return
+            
+            nameservers = [ns.strip() for ns in ns_input.split(",") if ns.strip()]
+            
+            result = {
+                "name": name,
+                "kind": kind,
+                "nameservers": nameservers
+            }
+            
+            # Add server index if multiple servers
+            if len(self.managers) > 1:
+                server_idx = self.query_one("#server-select", Select).value
+                result["server_idx"] = int(server_idx)
+            else:
+                result["server_idx"] = 0
+            
+            self.dismiss(result)
+        else:
+            self.dismiss(None)
+    
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+
+class CreateRecordModal(ModalScreen[Dict]):
+    """Modal dialog for creating a new DNS record."""
+    
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+    ]
+    
+    def __init__(self, zone_name: str):
+        super().__init__()
+        self.zone_name = zone_name
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="modal-dialog"):
+            yield Static(f"Create New Record in {self.zone_name}", classes="dialog-title")
+            yield Label("Record Name:")
+            yield Input(placeholder="www", id="record-name")
+            yield Label("Record Type:")
+            yield Select([
+                ("A", "A"),
+                ("AAAA", "AAAA"),
+                ("CNAME", "CNAME"),
+                ("MX", "MX"),
+                ("TXT", "TXT"),
+                ("NS", "NS"),
+                ("SRV", "SRV"),
+                ("PTR", "PTR"),
+            ], value="A", id="record-type")
+            yield Label("Content:")
+            yield TextArea(id="record-content")
+            yield Label("TTL (seconds):")
+            yield Input(placeholder="3600", value="3600", id="record-ttl")
+            with Horizontal(classes="dialog-buttons"):
+                yield Button("Create", variant="primary", id="create-btn")
+                yield Button("Cancel", variant="default", id="cancel-btn")
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "create-btn":
+            name = self.query_one("#record-name", Input).value.strip()
+            rtype = self.query_one("#record-type", Select).value
+            content = self.query_one("#record-content", TextArea).text.strip()
+            ttl_str = self.query_one("#record-ttl", Input).value.strip()
+            
+            if not name or not content:
+                self.notify("Name and content are required", severity="error")
+                return
+            
+            try:
+                ttl = int(ttl_str)
+            except ValueError:
+                self.notify("TTL must be a number", severity="error")
+                return
+            
+            self.dismiss({
+                "name": name,
+                "type": rtype,
+                "content": content,
+                "ttl": ttl
+            })
+        else:
+            self.dismiss(None)
+    
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+
+class EditRecordModal(ModalScreen[Dict]):
+    """Modal dialog for editing an existing DNS record."""
+    
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+    ]
+    
+    def __init__(self, zone_name: str, record: Record):
+        super().__init__()
+        self.zone_name = zone_name
+        self.record = record
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="modal-dialog"):
+            yield Static(f"Edit Record in {self.zone_name}", classes="dialog-title")
+            yield Label(f"Record Name: {self.record.name}")
+            yield Label(f"Record Type: {self.record.type}")
+            yield Label("Content:")
+            yield TextArea(self.record.content, id="record-content")
+            yield Label("TTL (seconds):")
+            yield Input(value=str(self.record.ttl), id="record-ttl")
+            with Horizontal(classes="dialog-buttons"):
+                yield Button("Save", variant="primary", id="save-btn")
+                yield Button("Cancel", variant="default", id="cancel-btn")
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "save-btn":
+            content = self.query_one("#record-content", TextArea).text.strip()
+            ttl_str = self.query_one("#record-ttl", Input).value.strip()
+            
+            if not content:
+                self.notify("Content is required", severity="error")
+                return
+            
+            try:
+                ttl = int(ttl_str)
+            except ValueError:
+                self.notify("TTL must be a number", severity="error")
+                return
+            
+            self.dismiss({
+                "content": content,
+                "ttl": ttl
+            })
+        else:
+            self.dismiss(None)
+    
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+
+class ConfirmModal(ModalScreen[bool]):
+    """Modal dialog for confirmation."""
+    
+    def __init__(self, message: str):
+        super().__init__()
+        self.message = message
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="modal-dialog"):
+            yield Static("Confirm Action", classes="dialog-title")
+            yield Static(self.message)
+            with Horizontal(classes="dialog-buttons"):
+                yield Button("Yes", variant="error", id="yes-btn")
+                yield Button("No", variant="default", id="no-btn")
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.dismiss(event.button.id == "yes-btn")
+
+
+class ZoneDetailsScreen(Screen):
+    """Screen showing DNS records for a specific zone."""
+    
+    BINDINGS = [
+        ("escape", "back", "Back to zones"),
+        ("c", "create_record", "Create record"),
+        ("d", "delete_record", "Delete record"),
+        ("e", "edit_record", "Edit record"),
+        ("r", "refresh", "Refresh"),
+        ("slash", "search", "Search"),
+    ]
+    
+    def __init__(self, manager: PDNSManager, zone_id: str, zone_name: str):
+        super().__init__()
+        self.manager = manager
+        self.zone_id = zone_id
+        self.zone_name = zone_name
+        self.zone = None
+        self.all_records = []
+        # Indices into all_records of the rows currently shown in the table
+        self._visible_indices = []
+        self._last_term = ""
+        self._filter_timer = None
+        # Trigram -> ascending indices of the records whose search key contains it
+        self._ngram_index = defaultdict(list)
+        # Bumped per load so results from a superseded load are dropped
+        self._load_generation = 0
+    
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Container():
+            yield Static(f"Zone: {self.zone_name}", id="zone-title")
+            yield Input(placeholder="Search records...", id="record-search")
+            yield DataTable(id="records-table")
+        yield Footer()
+    
+    def on_mount(self) -> None:
+        table = self.query_one("#records-table", DataTable)
+        table.cursor_type = "row"
+        table.add_columns("Name", "Type", "Content", "TTL", "Disabled")
+        self.load_records()
+    
+    def _fetch_rrsets(self):
+        """Fetch the zone and its RRSets (blocking, run in a thread)."""
+        zone = self.manager.get_zone(self.zone_id)
+        rrsets = zone.details.get('rrsets', [])
+        self.manager.record_counts[self.zone_id] = len(rrsets)
+        return zone, rrsets
+    
+    def load_records(self):
+        """Load all DNS records for the zone."""
+        self._load_generation += 1
+        self._load_records_worker(self._load_generation)
+    
+    @work(thread=True, exclusive=True)
+    def _load_records_worker(self, generation: int) -> None:
+        """Fetch the zone in a thread and stream its records into the table."""
+        worker = get_current_worker()
+        try:
+            zone, rrsets = self._fetch_rrsets()
+        except Exception as e:
+            self.app.call_from_thread(
+                self._if_current, generation, self.notify, f"Error loading records: {str(e)}", severity="error"
+            )
+            return
+        
+        # Cancelling a thread worker doesn't stop it, so a superseded load must not touch the table
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(self._if_current, generation, self._reset_records, zone)
+        
+        chunk = []
+        chunk_index = defaultdict(list)
+        total = 0
+        for rrset in rrsets:
+            # TTL is per RRSet, so read and format it once rather than for every record
+            name = rrset.get('name', '')
+            rtype = rrset.get('type', '')
+            ttl = rrset.get('ttl', 3600)
+            ttl_str = str(ttl)
+            
+            for record in rrset.get('records') or ():
+                content = record.get('content', '')
+                disabled = record.get('disabled', False)
+                entry = Record(name, rtype, content, ttl, ttl_str, disabled)
+                for gram in _trigrams(entry.search):
+                    chunk_index[gram].append(total + len(chunk))
+                chunk.append(entry)
+                
+                if len(chunk) >= 500:
+                    if worker.is_cancelled:
+                        return
+                    self.app.call_from_thread(self._if_current, generation, self._append_records, chunk, chunk_index)
+                    total += len(chunk)
+                    chunk = []
+                    chunk_index = defaultdict(list)
+        
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(self._if_current, generation, self._append_records, chunk, chunk_index)
+        total += len(chunk)
+        self.app.call_from_thread(self._if_current, generation, self.notify, f"Loaded {total} records")
+    
+    def _if_current(self, generation: int, callback, *args, **kwargs) -> None:
+        """Run a load worker's UI update unless a newer load has started since."""
+        if generation == self._load_generation:
+            callback(*args, **kwargs)
+    
+    def _reset_records(self, zone) -> None:
+        """Drop the previously loaded records before a fresh load streams in."""
+        self.zone = zone
+        self.all_records = []
+        self._visible_indices = []
+        self._ngram_index = defaultdict(list)
+        self.query_one("#records-table", DataTable).clear()
+    
+    def _append_records(self, records: List[Record], ngram_index: Dict[str, List[int]]) -> None:
+        """Add a batch of loaded records, showing the ones matching the current search."""
+        start = len(self.all_records)
+        self.all_records.extend(records)
+        for gram, indices in ngram_index.items():
+            self._ngram_index[gram].extend(indices)
+        
+        rows = []
+        for i, record in enumerate(records, start):
+            if self._last_term in record.search:
+                self._visible_indices.append(i)
+                rows.append(record.row)
+        
+        table = self.query_one("#records-table", DataTable)
+        with self.app.batch_update():
+            table.add_rows(rows)
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "record-search":
+            # Debounce so a burst of keystrokes results in a single filter pass
+            if self._filter_timer:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(0.15, lambda: self.filter_records(event.value))
+    
+    def filter_records(self, search_term: str):
+        """Filter records based on search term."""
+        search_lower = search_term.lower()
+        
+        # A term containing the previous one can only narrow the matches. A
+        # previous term under 3 characters matches too broadly to be worth
+        # narrowing, so the trigram index is used instead once it applies
+        narrowing = self._last_term in search_lower
+        if narrowing and len(self._last_term) >= 3:
+            candidates = self._visible_indices
+        elif len(search_lower) >= 3:
+            candidates = self._ngram_candidates(search_lower)
+        elif narrowing:
+            candidates = self._visible_indices
+        else:
+            candidates = range(len(self.all_records))
+        
+        visible = []
+        rows = []
+        for i in candidates:
+            record = self.all_records[i]
+            if search_lower in record.search:
+                visible.append(i)
+                rows.append(record.row)
+        
+        table = self.query_one("#records-table", DataTable)
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(rows)
+        
+        self._visible_indices = visible
+        self._last_term = search_lower
+    
+    def _ngram_candidates(self, search_lower: str) -> List[int]:
+        """Indices of records containing every trigram of the search term.
+        
+        This is a superset of the actual matches; callers still check the
+        full term against each candidate.
+        """
+        postings = sorted((self._ngram_index.get(gram, ()) for gram in _trigrams(search_lower)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return sorted(candidates)
+    
+    def action_back(self) -> None:
+        self.app.pop_screen()
+        # Refresh the zones screen when we go back
+        zones_screen = self.app.screen
+        if isinstance(zones_screen, ZonesScreen):
+            zones_screen.reload_zones()
+    
+    def action_refresh(self) -> None:
+        self.manager.invalidate(self.zone_id)
+        self.load_records()
+    
+    def action_search(self) -> None:
+        self.query_one("#record-search", Input).focus()
+    
+    def action_create_record(self) -> None:
+        self.app.push_screen(CreateRecordModal(self.zone_name), callback=self.on_create_record_result)
+    
+    def on_create_record_result(self, result) -> None:
+        if result:
+            try:
+                # Add the record to the zone
+                zone = self.zone or self.manager.get_zone(self.zone_id)
+                full_name = f"{result['name']}.{self.zone_name}" if result['name'] else self.zone_name
+                if not full_name.endswith('.'):
+                    full_name += '.'
+                
+                # Create RRSet for the new record
+                rrset = RRSet(
+                    name=full_name,
+                    rtype=result['type'],
+                    records=[(result['content'], False)],
+                    ttl=result['ttl']
+                )
+                zone.create_records([rrset])
+                
+                self.manager.invalidate(self.zone_id)
+                self.notify(f"Record created successfully", severity="information")
+                self.load_records()
+            except Exception as e:
+                self.notify(f"Error creating record: {str(e)}", severity="error")
+    
+    def action_edit_record(self) -> None:
+        table = self.query_one("#records-table", DataTable)
+        if table.cursor_row < 0 or table.cursor_row >= len(self._visible_indices):
+            self.notify("Please select a record to edit", severity="warning")
+            return
+        
+        record = self.all_records[self._visible_indices[table.cursor_row]]
+        self.app.push_screen(
+            EditRecordModal(self.zone_name, record),
+            callback=lambda result: self.on_edit_record_result(result, record)
+        )
+    
+    def on_edit_record_result(self, result, record) -> None:
+        if result:
+            try:
+                zone = self.zone or self.manager.get_zone(self.zone_id)
+                rrset = RRSet(
+                    name=record.name,
+                    rtype=record.type,
+                    records=[(result['content'], record.disabled)],
+                    ttl=result['ttl']
+                )
+                zone.create_records([rrset])
+                
+                self.manager.invalidate(self.zone_id)
+                self.notify(f"Record updated successfully", severity="information")
+                self.load_records()
+            except Exception as e:
+                self.notify(f"Error updating record: {str(e)}", severity="error")
+    
+    def action_delete_record(self) -> None:
+        table = self.query_one("#records-table", DataTable)
+        if table.cursor_row < 0 or table.cursor_row >= len(self._visible_indices):
+            self.notify("Please select a record to delete", severity="warning")
+            return
+        
+        record = self.all_records[self._visible_indices[table.cursor_row]]
+        self.app.push_screen(
+            ConfirmModal(f"Delete record {record.name} ({record.type})?"),
+            callback=lambda confirmed: self.on_delete_record_result(confirmed, record)
+        )
+    
+    def on_delete_record_result(self, confirmed, record) -> None:
+        if confirmed:
+            try:
+                zone = self.zone or self.manager.get_zone(self.zone_id)
+                rrset = RRSet(
+                    name=record.name,
+                    rtype=record.type,
+                    records=[]
+                )
+                zone.delete_records([rrset])
+                
+                self.manager.invalidate(self.zone_id)
+                self.notify(f"Record deleted successfully", severity="information")
+                self.load_records()
+            except Exception as e:
+                self.notify(f"Error deleting record: {str(e)}", severity="error")
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        # Button handling removed - use keyboard shortcuts instead
+        pass
+
+
+class ZonesScreen(Screen):
+    """Main screen showing all zones from all configured servers."""
+    
+    BINDINGS = [
+        ("q", "quit", "Quit"),
+        ("c", "create_zone", "Create zone"),
+        ("d", "delete_zone", "Delete zone"),
+        ("r", "refresh", "Refresh"),
+        ("slash", "search", "Search"),
+    ]
+    
+    def __init__(self, managers: List[PDNSManager]):
+        super().__init__()
+        self.managers = managers
+        self.all_zones = []
+        # Indices into all_zones of the rows currently shown in the table
+        self._visible_indices = []
+        self._last_term = ""
+        self._filter_timer = None
+        # Servers can connect before on_mount has set up the table columns
+        self._table_ready = False
+    
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with Container():
+            yield Static("PowerDNS Zone Manager", id="app-title")
+            yield Input(placeholder="Search zones...", id="zone-search")
+            yield DataTable(id="zones-table")
+            yield Static("Press Enter to view zone records | c: Create | d: Delete | r: Refresh | /: Search | q: Quit", 
+                        id="help-text")
+        yield Footer()
+    
+    def on_mount(self) -> None:
+        table = self.query_one("#zones-table", DataTable)
+        table.cursor_type = "row"
+        table.add_columns("Server", "FQDN", "Zone", "Kind", "Serial", "Records", "Notified Serial")
+        self._table_ready = True
+        if self.managers:
+            self.reload_zones()
+        else:
+            # Servers are still connecting; add_manager() fills the table in as they come up
+            table.loading = True
+    
+    def add_manager(self, manager: PDNSManager) -> None:
+        """Add a newly connected server and reload the zone list."""
+        self.managers.append(manager)
+        if not self._table_ready:
+            # on_mount loads every server added so far
+            return
+        self.query_one("#zones-table", DataTable).loading = False
+        # Listings of servers that were already loaded come from the manager cache
+        self.reload_zones()
+    
+    def reload_zones(self) -> None:
+        """Reload the zone list; a newer reload supersedes one still in flight."""
+        self.run_worker(self.load_zones, group="load-zones", exclusive=True)
+    
+    def _fetch_zones(self, manager_idx: int) -> List[ZoneInfo]:
+        """Fetch zone summaries from one server (blocking, run in a thread)."""
+        manager = self.managers[manager_idx]
+        zones = []
+        for zone in manager.get_zones():
+            # Only listing fields are used here; fetching each zone for its
+            # record count would cost one request per zone
+            zones.append(ZoneInfo(
+                manager_idx,
+                manager,
+                zone['name'],
+                zone.get('kind', 'N/A'),
+                zone.get('serial', 'N/A'),
+                manager.record_counts.get(zone['name'], '-'),
+                zone.get('notified_serial', 'N/A')
+            ))
+        return zones
+    
+    async def load_zones(self):
+        """Load all zones from all configured servers."""
+        # Query every server concurrently so the wait is the slowest server, not the sum
+        results = await asyncio.gather(
+            *[asyncio.to_thread(self._fetch_zones, idx) for idx in range(len(self.managers))],
+            return_exceptions=True
+        )
+        
+        self.all_zones = []
+        rows = []
+        
+        for manager, zones in zip(self.managers, results):
+            if isinstance(zones, Exception):
+                self.notify(f"Error loading zones from {manager.name}: {str(zones)}", severity="error")
+                continue
+            self.all_zones.extend(zones)
+            rows.extend(zone.row for zone in zones)
+        
+        table = self.query_one("#zones-table", DataTable)
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(rows)
+        
+        self._visible_indices = list(range(len(self.all_zones)))
+        self._last_term = ""
+        # Keep whatever the user has typed applied across reloads
+        search = self.query_one("#zone-search", Input).value
+        if search:
+            self.filter_zones(search)
+        self.notify(f"Loaded {len(self.all_zones)} zones from {len(self.managers)} server(s)")
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "zone-search":
+            # Debounce so a burst of keystrokes results in a single filter pass
+            if self._filter_timer:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(0.15, lambda: self.filter_zones(event.value))
+    
+    def filter_zones(self, search_term: str):
+        """Filter zones based on search term."""
+        search_lower = search_term.lower()
+        
+        # A term containing the previous one can only narrow the matches
+        if self._last_term in search_lower:
+            candidates = self._visible_indices
+        else:
+            candidates = range(len(self.all_zones))
+        
+        visible = []
+        rows = []
+        for i in candidates:
+            zone = self.all_zones[i]
+            if search_lower in zone.search:
+                visible.append(i)
+                rows.append(zone.row)
+        
+        table = self.query_one("#zones-table", DataTable)
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(rows)
+        
+        self._visible_indices = visible
+        self._last_term = search_lower
+    
+    def action_refresh(self) -> None:
+        for manager in self.managers:
+            manager.invalidate()
+        self.reload_zones()
+    
+    def action_search(self) -> None:
+        self.query_one("#zone-search", Input).focus()
+    
+    def action_create_zone(self) -> None:
+        if not self.managers:
+            self.notify("No servers connected yet", severity="warning")
+            return
+        self.app.push_screen(CreateZoneModal(self.managers), callback=self.on_create_zone_result)
+    
+    def on_create_zone_result(self, result) -> None:
+        if result:
+            try:
+                manager = self.managers[result['server_idx']]
+                manager.create_zone(
+                    name=result['name'],
+                    kind=result['kind'],
+                    nameservers=result['nameservers']
+                )
+                self.notify(f"Zone {result['name']} created successfully on {manager.name}", severity="information")
+                self.reload_zones()
+            except Exception as e:
+                self.notify(f"Error creating zone: {str(e)}", severity="error")
+    
+    def action_delete_zone(self) -> None:
+        table = self.query_one("#zones-table", DataTable)
+        if table.cursor_row < 0 or table.cursor_row >= len(self._visible_indices):
+            self.notify("Please select a zone to delete", severity="warning")
+            return
+        
+        zone = self.all_zones[self._visible_indices[table.cursor_row]]
+        self.app.push_screen(
+            ConfirmModal(f"Delete zone {zone.name}?"),
+            callback=lambda confirmed: self.on_delete_zone_result(confirmed, zone)
+        )
+    
+    def on_delete_zone_result(self, confirmed, zone) -> None:
+        if confirmed:
+            try:
+                self.managers[zone.manager_idx].delete_zone(zone.id)
+                self.notify(f"Zone {zone.name} deleted successfully", severity="information")
+                self.reload_zones()
+            except Exception as e:
+                self.notify(f"Error deleting zone: {str(e)}", severity="error")
+    
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        zone = self.all_zones[self._visible_indices[event.cursor_row]]
+        self.app.push_screen(
+            ZoneDetailsScreen(self.managers[zone.manager_idx], zone.id, zone.name)
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        # Button handling removed - use keyboard shortcuts instead
+        pass
+
+
+class PowerDNSTUI(App):
+    """PowerDNS TUI Application."""
+    
+    CSS = """
+    Screen {
+        background: $surface;
+    }
+    
+    #app-title {
+        text-align: center;
+        color: #1f77b4;
+        text-style: bold;
+        padding: 1;
+        background: $boost;
+    }
+    
+    #zone-title {
+        text-align: center;
+        color: #1f77b4;
+        text-style: bold;
+        padding: 1;
+        background: $boost;
+    }
+    
+    #help-text {
+        text-align: center;
+        padding: 1;
+        color: $text-muted;
+        background: $panel;
+    }
+    
+    DataTable {
+        height: 1fr;
+        background: $surface;
+    }
+    
+    DataTable > .datatable--header {
+        background: #1f77b4;
+        color: $text;
+        text-style: bold;
+    }
+    
+    DataTable > .datatable--cursor {
+        background: #5da5da;
+        color: $text;
+    }
+    
+    DataTable:focus > .datatable--cursor {
+        background: #1f77b4;
+        color: white;
+    }
+    
+    Input {
+        margin: 1 2;
+        border: solid #1f77b4;
+    }
+    
+    Input:focus {
+        border: solid #5da5da;
+    }
+    
+    .modal-dialog {
+        width: 60;
+        height: auto;
+        background: $surface;
+        border: thick #1f77b4;
+        padding: 1 2;
+    }
+    
+    .dialog-title {
+        text-align: center;
+        color: #1f77b4;
+        text-style: bold;
+        padding-bottom: 1;
+        background: $boost;
+    }
+    
+    .dialog-buttons {
+        height: auto;
+        padding-top: 1;
+        align: center middle;
+    }
+    
+    .dialog-buttons Button {
+        margin: 0 1;
+    }
+    
+    Button {
+        background: #1f77b4;
+        color: white;
+    }
+    
+    Button:hover {
+        background: #5da5da;
+    }
+    
+    Button.-primary {
+        background: #1f77b4;
+        color: white;
+        text-style: bold;
+    }
+    
+    Button.-primary:hover {
+        background: #5da5da;
+    }
+    
+    Button.-error {
+        background: #e74c3c;
+        color: white;
+    }
+    
+    Button.-error:hover {
+        background: #c0392b;
+    }
+    
+    Label {
+        padding: 1 0 0 0;
+        color: #1f77b4;
+    }
+    
+    TextArea {
+        height: 5;
+        margin: 0 0 1 0;
+        border: solid #1f77b4;
+    }
+    
+    TextArea:focus {
+        border: solid #5da5da;
+    }
+    
+    Select {
+        border: solid #1f77b4;
+    }
+    
+    Select:focus {
+        border: solid #5da5da;
+    }
+    
+    Header {
+        background: #1f77b4;
+        color: white;
+    }
+    
+    Footer {
+        background: #1f77b4;
+        color: white;
+    }
+    
+    Footer > .footer--highlight {
+        background: #5da5da;
+    }
+    
+    Footer > .footer--key {
+        background: #2980b9;
+        color: white;
+    }
+    """
+    
+    BINDINGS = [
+        Binding("q", "quit", "Quit", show=True),
+    ]
+    
+    def __init__(self, config: "Config"):
+        super().__init__()
+        self.config = config
+        self.managers = []
+    
+    def _connect_one(self, server: "ServerConfig") -> PDNSManager:
+        """Create a manager and connect it (blocking, run in a thread)."""
+        manager = PDNSManager(
+            url=server.url,
+            api_key=server.api_key,
+            name=server.name
+        )
+        manager.connect()
+        return manager
+    
+    def on_mount(self) -> None:
+        """Show the zones screen right away and connect to servers in the background."""
+        zones_screen = ZonesScreen(self.managers)
+        self.push_screen(zones_screen)
+        self._connect_servers(zones_screen)
+    
+    @work(thread=True, exclusive=True)
+    def _connect_servers(self, zones_screen: ZonesScreen) -> None:
+        """Connect to all servers concurrently, handing each over as it comes up."""
+        worker = get_current_worker()
+        failures = []
+        connected = 0
+        # One failure doesn't stop the others, and a slow server doesn't hold up the rest
+        pool = ThreadPoolExecutor(max_workers=max(1, len(self.config.servers)))
+        futures = {pool.submit(self._connect_one, server): server for server in self.config.servers}
+        pending = set(futures)
+        while pending:
+            # Wake up regularly so quitting isn't held up by a server that hangs
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            if worker.is_cancelled:
+                pool.shutdown(wait=False, cancel_futures=True)
+                return
+            for future in done:
+                server = futures[future]
+                try:
+                    manager = future.result()
+                except Exception as e:
+                    # connect() already names the server in its error
+                    failures.append(str(e))
+                    continue
+                connected += 1
+                self.call_from_thread(zones_screen.add_manager, manager)
+                self.call_from_thread(self.notify, f"Connected to {server.name}", severity="information")
+        pool.shutdown()
+        
+        if failures and connected:
+            # One notification for all failures rather than a toast (and render) per server
+            self.call_from_thread(self.notify, "\n".join(failures), severity="warning")
+        
+        if not connected:
+            # Nothing to manage; leave the terminal and print why instead of an empty screen
+            self.call_from_thread(
+                self.exit,
+                return_code=1,
+                message="\n".join(failures + ["No servers connected. Please check your configuration."])
+            )
+